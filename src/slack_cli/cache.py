@@ -0,0 +1,191 @@
+"""Caching helpers for Slack CLI."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, MutableMapping
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(MutableMapping[K, V], Generic[K, V]):
+    """Thread-safe mapping with per-entry expiry and LRU eviction.
+
+    Entries older than ``ttl`` seconds are treated as missing. Once the
+    cache holds ``maxsize`` entries, the least recently used one is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        expired = [key for key, (expires, _) in self._data.items() if expires <= now]
+        for key in expired:
+            del self._data[key]
+
+    def __getitem__(self, key: K) -> V:
+        with self._lock:
+            expires, value = self._data[key]
+            if expires <= time.monotonic():
+                del self._data[key]
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __delitem__(self, key: K) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._data.get(key)  # type: ignore[call-overload]
+            return entry is not None and entry[0] > time.monotonic()
+
+    def __iter__(self) -> Iterator[K]:
+        with self._lock:
+            self._expire()
+            keys = list(self._data)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._data)
+
+    def values(self) -> list[V]:  # type: ignore[override]
+        """Return a snapshot of the live values."""
+        with self._lock:
+            self._expire()
+            return [value for _, value in self._data.values()]
+
+
+class DiskCache:
+    """SQLite-backed key/value store that persists between CLI invocations.
+
+    Values are JSON-serializable dicts grouped by ``kind`` (e.g. "user",
+    "channel") and indexed by name for lookups. The file holds private
+    workspace data, so it is only readable by the owner. Any storage error
+    disables the cache for the rest of the process instead of failing the
+    command.
+    """
+
+    def __init__(self, path: Path, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                os.chmod(self.path.parent, 0o700)
+                os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+                os.chmod(self.path, 0o600)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    " kind TEXT NOT NULL,"
+                    " key TEXT NOT NULL,"
+                    " name TEXT NOT NULL,"
+                    " value TEXT NOT NULL,"
+                    " expires REAL NOT NULL,"
+                    " PRIMARY KEY (kind, key))"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS entries_name ON entries (kind, name)"
+                )
+                conn.execute("DELETE FROM entries WHERE expires <= ?", (time.time(),))
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                self._disabled = True
+        return self._conn
+
+    def _execute(self, sql: str, params: Iterable[Any] = ()) -> list[tuple[Any, ...]]:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return []
+            try:
+                rows = conn.execute(sql, tuple(params)).fetchall()
+                conn.commit()
+                return rows
+            except sqlite3.Error:
+                self._disabled = True
+                self._conn = None
+                return []
+
+    def get(self, kind: str, key: str) -> dict[str, Any] | None:
+        """Return the cached value for a key, or None if missing or expired."""
+        rows = self._execute(
+            "SELECT value FROM entries WHERE kind = ? AND key = ? AND expires > ?",
+            (kind, key, time.time()),
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def find(self, kind: str, name: str) -> dict[str, Any] | None:
+        """Return the first live value of the given kind with a matching name."""
+        rows = self._execute(
+            "SELECT value FROM entries WHERE kind = ? AND name = ? AND expires > ?"
+            " LIMIT 1",
+            (kind, name, time.time()),
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def set_many(
+        self,
+        kind: str,
+        items: Iterable[tuple[str, str, dict[str, Any]]],
+        ttl: float | None = None,
+    ) -> None:
+        """Store (key, name, value) triples in a single transaction.
+
+        ``ttl`` overrides the cache-wide default for these entries.
+        """
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        rows = [
+            (kind, key, name, json.dumps(value), expires) for key, name, value in items
+        ]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries (kind, key, name, value, expires)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.commit()
+            except sqlite3.Error:
+                self._disabled = True
+                self._conn = None
+
+    def set(self, kind: str, key: str, name: str, value: dict[str, Any]) -> None:
+        """Store a single value."""
+        self.set_many(kind, [(key, name, value)])
+
+    def delete(self, kind: str, key: str) -> None:
+        """Remove a single entry."""
+        self._execute("DELETE FROM entries WHERE kind = ? AND key = ?", (kind, key))
@@ -1,17 +1,62 @@
 """Slack API client wrapper."""
 
+import hashlib
 import os
-from dataclasses import dataclass
-from typing import Any
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, TypeVar
 
-from dotenv import load_dotenv
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
-load_dotenv()
+from .cache import DiskCache, TTLCache
 
+# Below this many unresolved user IDs, per-ID users_info calls are cheaper
+# than paginating the whole users.list.
+USER_PREFETCH_THRESHOLD = 5
 
-@dataclass
+# Slack recommends keeping concurrent requests per token to a handful.
+MAX_CONCURRENT_REQUESTS = 3
+
+# Slack caps list endpoints at 1000 items per page; fewer, larger pages
+# mean fewer round-trips.
+PAGE_LIMIT = 1000
+FALLBACK_PAGE_LIMIT = 500
+
+RATE_LIMIT_RETRIES = 3
+CONNECTION_RETRIES = 2
+
+CACHE_MAXSIZE = 10_000
+USER_CACHE_TTL = 2 * 60 * 60
+# Topics and member counts change more often than user profiles.
+CHANNEL_CACHE_TTL = 5 * 60
+# Persisted channel names only serve name/ID resolution across invocations,
+# so they can outlive full channel entries.
+DISK_CACHE_TTL = 2 * 60 * 60
+
+T = TypeVar("T")
+
+
+def _disk_cache_path(token: str) -> Path:
+    """Return the per-workspace cache file, keyed by a hash of the token."""
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha256(token.encode()).hexdigest()[:16]
+    return Path(base) / "slack-cli" / f"cache-{digest}.sqlite"
+
+
+def _restore(cls: type[T], data: dict[str, Any] | None) -> T | None:
+    """Rebuild a cached dataclass; entries from an older schema are misses."""
+    if data is None:
+        return None
+    try:
+        return cls(**data)
+    except TypeError:
+        return None
+
+
+@dataclass(slots=True)
 class Message:
     """Represents a Slack message."""
 
@@ -24,7 +69,7 @@ class Message:
     permalink: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Channel:
     """Represents a Slack channel."""
 
@@ -36,8 +81,21 @@ class Channel:
     purpose: str
     member_count: int | None = None
 
-
-@dataclass
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "Channel":
+        """Build a Channel from a conversations.* API payload."""
+        return cls(
+            id=data["id"],
+            name=data.get("name", data["id"]),
+            is_private=data.get("is_private", False),
+            is_archived=data.get("is_archived", False),
+            topic=data.get("topic", {}).get("value", ""),
+            purpose=data.get("purpose", {}).get("value", ""),
+            member_count=data.get("num_members"),
+        )
+
+
+@dataclass(slots=True)
 class User:
     """Represents a Slack user."""
 
@@ -47,8 +105,19 @@ class User:
     display_name: str
     is_bot: bool
 
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "User":
+        """Build a User from a users.* API payload."""
+        return cls(
+            id=data["id"],
+            name=data.get("name", ""),
+            real_name=data.get("real_name", ""),
+            display_name=data.get("profile", {}).get("display_name", ""),
+            is_bot=data.get("is_bot", False),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class Conversation:
     """Represents a DM conversation."""
 
@@ -62,31 +131,124 @@ class SlackClient:
     """Wrapper for Slack Web API."""
 
     def __init__(self, token: str | None = None):
+        from dotenv import load_dotenv
+        from slack_sdk import WebClient
+        from slack_sdk.http_retry.builtin_handlers import (
+            ConnectionErrorRetryHandler,
+            RateLimitErrorRetryHandler,
+        )
+
+        load_dotenv()
         self.token = token or os.getenv("SLACK_CLI_TOKEN")
         if not self.token:
             raise ValueError(
                 "Slack token not found. Set SLACK_CLI_TOKEN environment variable."
             )
-        self.client = WebClient(token=self.token)
-        self._user_cache: dict[str, User] = {}
-        self._channel_cache: dict[str, Channel] = {}
+        # Wait out HTTP 429s (honoring Retry-After) and transient connection
+        # errors instead of failing the command.
+        self.client = WebClient(
+            token=self.token,
+            retry_handlers=[
+                ConnectionErrorRetryHandler(max_retry_count=CONNECTION_RETRIES),
+                RateLimitErrorRetryHandler(max_retry_count=RATE_LIMIT_RETRIES),
+            ],
+        )
+        self._user_cache: TTLCache[str, User] = TTLCache(
+            maxsize=CACHE_MAXSIZE, ttl=USER_CACHE_TTL
+        )
+        self._channel_cache: TTLCache[str, Channel] = TTLCache(
+            maxsize=CACHE_MAXSIZE, ttl=CHANNEL_CACHE_TTL
+        )
+        self._page_limit = PAGE_LIMIT
+        # Set by iter_channels when max_pages left pages unfetched.
+        self.has_more_channels = False
+        self._disk_cache = DiskCache(_disk_cache_path(self.token), ttl=DISK_CACHE_TTL)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop a user from the cache so the next lookup refetches it."""
+        self._user_cache.pop(user_id, None)
+        self._disk_cache.delete("user", user_id)
+
+    def invalidate_channel(self, channel_id: str) -> None:
+        """Drop a channel from the cache so the next lookup refetches it."""
+        self._channel_cache.pop(channel_id, None)
+        self._disk_cache.delete("channel", channel_id)
+        self._disk_cache.delete("channel_name", channel_id)
+
+    def _cache_users(self, users: Iterable[User]) -> None:
+        """Write users through to the in-memory and on-disk caches."""
+        users = list(users)
+        for user in users:
+            self._user_cache[user.id] = user
+        self._disk_cache.set_many("user", ((u.id, u.name, asdict(u)) for u in users))
+
+    def _cache_channels(self, channels: Iterable[Channel]) -> None:
+        """Write channels through to the in-memory and on-disk caches."""
+        channels = list(channels)
+        for channel in channels:
+            self._channel_cache[channel.id] = channel
+        self._disk_cache.set_many(
+            "channel",
+            ((ch.id, ch.name, asdict(ch)) for ch in channels),
+            ttl=CHANNEL_CACHE_TTL,
+        )
+        self._disk_cache.set_many(
+            "channel_name",
+            ((ch.id, ch.name, {"id": ch.id, "name": ch.name}) for ch in channels),
+        )
+
+    def _prefetch_channels(self, channels: Iterable[dict[str, Any]]) -> None:
+        """Record channel names from partial channel payloads.
+
+        Slack has no bulk conversations.info, but search matches already
+        carry each channel's ID and name. They go to the on-disk name index
+        only, since the payload lacks the details a full Channel holds.
+        """
+        self._disk_cache.set_many(
+            "channel_name",
+            (
+                (ch["id"], ch["name"], {"id": ch["id"], "name": ch["name"]})
+                for ch in channels
+                if ch.get("id") and ch.get("name")
+            ),
+        )
+
+    def cached_channel_name(self, channel_id: str) -> str | None:
+        """Return a channel's name if known locally, without an API call."""
+        channel = self._channel_cache.get(channel_id)
+        if channel is not None:
+            return channel.name
+        data = self._disk_cache.get("channel_name", channel_id)
+        return data.get("name") if data else None
+
+    def _cached_user(self, user_id: str) -> User | None:
+        """Look up a user in memory, then on disk."""
+        user = self._user_cache.get(user_id)
+        if user is None:
+            user = _restore(User, self._disk_cache.get("user", user_id))
+            if user is not None:
+                self._user_cache[user_id] = user
+        return user
+
+    def _cached_channel(self, channel_id: str) -> Channel | None:
+        """Look up a channel in memory, then on disk."""
+        channel = self._channel_cache.get(channel_id)
+        if channel is None:
+            channel = _restore(Channel, self._disk_cache.get("channel", channel_id))
+            if channel is not None:
+                self._channel_cache[channel_id] = channel
+        return channel
 
     def _get_user(self, user_id: str) -> User:
         """Get user info with caching."""
-        if user_id in self._user_cache:
-            return self._user_cache[user_id]
+        cached = self._cached_user(user_id)
+        if cached is not None:
+            return cached
 
         try:
             response = self.client.users_info(user=user_id)
-            user_data = response["user"]
-            user = User(
-                id=user_data["id"],
-                name=user_data.get("name", ""),
-                real_name=user_data.get("real_name", ""),
-                display_name=user_data.get("profile", {}).get("display_name", ""),
-                is_bot=user_data.get("is_bot", False),
-            )
-            self._user_cache[user_id] = user
+            user = User.from_api(response["user"])
+            self._cache_users([user])
             return user
         except SlackApiError:
             return User(
@@ -97,24 +259,76 @@ class SlackClient:
                 is_bot=False,
             )
 
+    def _prefetch_users(self, user_ids: Iterable[str]) -> dict[str, User]:
+        """Resolve a batch of user IDs, returning a User for each.
+
+        Many unresolved IDs are filled in bulk from users.list; the rest
+        (e.g. deleted users) are looked up concurrently via users.info.
+        IDs that cannot be resolved map to _get_user's placeholder, so
+        callers should use the result rather than look them up again.
+        """
+        users: dict[str, User] = {}
+        missing: list[str] = []
+
+        def collect(ids: Iterable[str]) -> None:
+            for uid in ids:
+                cached = self._cached_user(uid)
+                if cached is None:
+                    missing.append(uid)
+                else:
+                    users[uid] = cached
+
+        collect(set(user_ids))
+        if len(missing) >= USER_PREFETCH_THRESHOLD:
+            try:
+                # Only the cache writes matter; don't keep every User around.
+                deque(self.iter_users(), maxlen=0)
+            except RuntimeError:
+                pass
+            pending = missing[:]
+            missing.clear()
+            collect(pending)
+
+        if missing:
+            workers = min(len(missing), MAX_CONCURRENT_REQUESTS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                users.update(zip(missing, executor.map(self._get_user, missing)))
+        return users
+
+    def _call_paged(self, method: Callable[..., Any], **kwargs: Any) -> Any:
+        """Call a paginated API method with the largest page size.
+
+        Some endpoints reject or throttle max-size pages under load, so
+        retry once with a smaller page and keep using it for later pages.
+        """
+        try:
+            return method(limit=self._page_limit, **kwargs)
+        except SlackApiError as e:
+            retryable = e.response["error"] in ("ratelimited", "invalid_limit")
+            if not retryable or self._page_limit == FALLBACK_PAGE_LIMIT:
+                raise
+            self._page_limit = FALLBACK_PAGE_LIMIT
+            return method(limit=self._page_limit, **kwargs)
+
+    def _usernames(self, items: list[dict[str, Any]]) -> dict[str, str]:
+        """Map each distinct author ID in a batch of payloads to a display name.
+
+        Users are prefetched and resolved once per batch, so building
+        Message objects only needs a dict lookup per item.
+        """
+        users = self._prefetch_users(m["user"] for m in items if m.get("user"))
+        return {uid: u.display_name or u.real_name for uid, u in users.items()}
+
     def _get_channel(self, channel_id: str) -> Channel:
         """Get channel info with caching."""
-        if channel_id in self._channel_cache:
-            return self._channel_cache[channel_id]
+        cached = self._cached_channel(channel_id)
+        if cached is not None:
+            return cached
 
         try:
             response = self.client.conversations_info(channel=channel_id)
-            channel_data = response["channel"]
-            channel = Channel(
-                id=channel_data["id"],
-                name=channel_data.get("name", channel_id),
-                is_private=channel_data.get("is_private", False),
-                is_archived=channel_data.get("is_archived", False),
-                topic=channel_data.get("topic", {}).get("value", ""),
-                purpose=channel_data.get("purpose", {}).get("value", ""),
-                member_count=channel_data.get("num_members"),
-            )
-            self._channel_cache[channel_id] = channel
+            channel = Channel.from_api(response["channel"])
+            self._cache_channels([channel])
             return channel
         except SlackApiError:
             return Channel(
@@ -126,25 +340,74 @@ class SlackClient:
                 purpose="",
             )
 
-    def _resolve_channel_id(self, channel: str) -> str:
-        """Resolve channel name to ID if needed."""
-        if channel.startswith("C") or channel.startswith("G"):
-            return channel
+    def _resolve_channel(self, channel: str) -> Channel:
+        """Resolve a channel name or ID to a Channel.
 
-        channels = self.list_channels(include_private=True)
-        for ch in channels:
-            if ch.name == channel or ch.name == channel.lstrip("#"):
-                return ch.id
-        return channel
+        Names are looked up in the in-memory cache and the on-disk name index
+        first, then by paging through conversations.list until the first
+        match.
+        """
+        if channel.startswith("C") or channel.startswith("G"):
+            return self._get_channel(channel)
+
+        name = channel.lstrip("#")
+        for ch in self._channel_cache.values():
+            if ch.name == name:
+                return ch
+
+        # Only the name -> ID mapping is trusted from disk; details come from
+        # the short-lived channel cache or a single conversations.info call.
+        data = self._disk_cache.find("channel_name", name)
+        if data is not None and data.get("id"):
+            found = self._get_channel(data["id"])
+            if found.name == name:
+                return found
+            # Renamed or gone since it was cached.
+            self.invalidate_channel(data["id"])
+
+        for ch in self.iter_channels(include_private=True):
+            if ch.name == name:
+                return ch
+
+        return Channel(
+            id=channel,
+            name=name,
+            is_private=False,
+            is_archived=False,
+            topic="",
+            purpose="",
+        )
 
     def _resolve_user_id(self, user: str) -> str:
-        """Resolve username to user ID if needed."""
+        """Resolve username or email to user ID if needed.
+
+        Emails use a single users.lookupByEmail call. Names are looked up in
+        the in-memory and on-disk caches first, then by paging through
+        users.list until the first match.
+        """
         if user.startswith("U"):
             return user
 
-        users = self.list_users()
         user_clean = user.lstrip("@")
-        for u in users:
+        if "@" in user_clean:
+            try:
+                response = self.client.users_lookupByEmail(email=user_clean)
+            except SlackApiError as e:
+                raise RuntimeError(f"Failed to look up user: {e.response['error']}")
+            found = User.from_api(response["user"])
+            self._cache_users([found])
+            return found.id
+
+        for u in self._user_cache.values():
+            if u.name == user_clean or u.display_name == user_clean:
+                return u.id
+
+        found = _restore(User, self._disk_cache.find("user", user_clean))
+        if found is not None:
+            self._user_cache[found.id] = found
+            return found.id
+
+        for u in self.iter_users():
             if u.name == user_clean or u.display_name == user_clean:
                 return u.id
         return user
@@ -158,9 +421,12 @@ class SlackClient:
         """Search messages in the workspace."""
         search_query = query
         if channel:
-            channel_id = self._resolve_channel_id(channel)
-            channel_info = self._get_channel(channel_id)
-            search_query = f"in:#{channel_info.name} {query}"
+            # The in: modifier takes a name, so only IDs need a lookup.
+            if channel.startswith("C") or channel.startswith("G"):
+                name = self.cached_channel_name(channel) or self._get_channel(channel).name
+            else:
+                name = channel.lstrip("#")
+            search_query = f"in:#{name} {query}"
 
         try:
             response = self.client.search_messages(
@@ -172,81 +438,108 @@ class SlackClient:
         except SlackApiError as e:
             raise RuntimeError(f"Search failed: {e.response['error']}")
 
-        messages = []
-        for match in response.get("messages", {}).get("matches", []):
-            user_id = match.get("user", "")
-            user = self._get_user(user_id) if user_id else None
-            channel_info = match.get("channel", {})
-
-            messages.append(
-                Message(
-                    text=match.get("text", ""),
-                    user=user_id,
-                    username=user.display_name or user.real_name if user else "Unknown",
-                    channel=channel_info.get("id", ""),
-                    channel_name=channel_info.get("name", ""),
-                    timestamp=match.get("ts", ""),
-                    permalink=match.get("permalink"),
-                )
+        matches = response.get("messages", {}).get("matches", [])
+        names = self._usernames(matches)
+        self._prefetch_channels(m["channel"] for m in matches if m.get("channel"))
+
+        return [
+            Message(
+                text=m.get("text", ""),
+                user=(user_id := m.get("user", "")),
+                username=names.get(user_id, "Unknown"),
+                channel=(channel_info := m.get("channel", {})).get("id", ""),
+                channel_name=channel_info.get("name", ""),
+                timestamp=m.get("ts", ""),
+                permalink=m.get("permalink"),
             )
-        return messages
+            for m in matches
+        ]
 
-    def list_channels(
+    def iter_channels(
         self,
         include_private: bool = False,
         include_archived: bool = False,
-    ) -> list[Channel]:
-        """List channels in the workspace."""
-        types = ["public_channel"]
-        if include_private:
-            types.append("private_channel")
+        max_pages: int | None = None,
+        types: list[str] | None = None,
+    ) -> Iterator[Channel]:
+        """Yield channels in the workspace page by page.
 
-        channels = []
-        cursor = None
-
-        while True:
-            try:
-                response = self.client.conversations_list(
-                    types=",".join(types),
-                    exclude_archived=not include_archived,
-                    limit=200,
-                    cursor=cursor,
-                )
-            except SlackApiError as e:
-                raise RuntimeError(f"Failed to list channels: {e.response['error']}")
-
-            for ch in response.get("channels", []):
-                channel = Channel(
-                    id=ch["id"],
-                    name=ch.get("name", ""),
-                    is_private=ch.get("is_private", False),
-                    is_archived=ch.get("is_archived", False),
-                    topic=ch.get("topic", {}).get("value", ""),
-                    purpose=ch.get("purpose", {}).get("value", ""),
-                    member_count=ch.get("num_members"),
-                )
-                channels.append(channel)
-                self._channel_cache[channel.id] = channel
+        Each channel type is paginated separately: Slack filters types after
+        fetching, so a combined query can burn pages on the unwanted type.
 
-            cursor = response.get("response_metadata", {}).get("next_cursor")
-            if not cursor:
-                break
+        Args:
+            include_private: Also include private channels
+            include_archived: Also include archived channels
+            max_pages: Stop after this many pages per type (None fetches all);
+                has_more_channels tells whether any pages were left unfetched
+            types: Conversation types to fetch, overriding include_private
+        """
+        self.has_more_channels = False
+        if types is None:
+            types = ["public_channel"]
+            if include_private:
+                types.append("private_channel")
+
+        for channel_type in types:
+            cursor = None
+            pages = 0
+
+            while True:
+                try:
+                    response = self._call_paged(
+                        self.client.conversations_list,
+                        types=channel_type,
+                        exclude_archived=not include_archived,
+                        cursor=cursor,
+                    )
+                except SlackApiError as e:
+                    raise RuntimeError(
+                        f"Failed to list channels: {e.response['error']}"
+                    )
+
+                page = [Channel.from_api(ch) for ch in response.get("channels", [])]
+                self._cache_channels(page)
+                yield from page
+
+                pages += 1
+                cursor = response.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+                if max_pages is not None and pages >= max_pages:
+                    self.has_more_channels = True
+                    break
 
-        return channels
+    def list_channels(
+        self,
+        include_private: bool = False,
+        include_archived: bool = False,
+        types: list[str] | None = None,
+    ) -> list[Channel]:
+        """List all channels in the workspace."""
+        return list(
+            self.iter_channels(
+                include_private=include_private,
+                include_archived=include_archived,
+                types=types,
+            )
+        )
 
     def get_channel_info(self, channel: str) -> Channel:
         """Get detailed info about a channel."""
-        channel_id = self._resolve_channel_id(channel)
-        return self._get_channel(channel_id)
+        return self._resolve_channel(channel)
 
     def get_channel_history(
         self,
         channel: str,
         limit: int = 50,
-    ) -> list[Message]:
-        """Get message history from a channel."""
-        channel_id = self._resolve_channel_id(channel)
-        channel_info = self._get_channel(channel_id)
+    ) -> tuple[list[Message], Channel]:
+        """Get message history from a channel.
+
+        Returns:
+            Tuple of (messages, channel) so callers need no separate lookup
+        """
+        channel_info = self._resolve_channel(channel)
+        channel_id = channel_info.id
 
         try:
             response = self.client.conversations_history(
@@ -254,69 +547,62 @@ class SlackClient:
                 limit=limit,
             )
         except SlackApiError as e:
+            self.invalidate_channel(channel_id)
             raise RuntimeError(f"Failed to get history: {e.response['error']}")
 
-        messages = []
-        for msg in response.get("messages", []):
-            user_id = msg.get("user", "")
-            user = self._get_user(user_id) if user_id else None
-
-            messages.append(
-                Message(
-                    text=msg.get("text", ""),
-                    user=user_id,
-                    username=user.display_name or user.real_name if user else "Bot",
-                    channel=channel_id,
-                    channel_name=channel_info.name,
-                    timestamp=msg.get("ts", ""),
-                )
+        history = response.get("messages", [])
+        names = self._usernames(history)
+
+        messages = [
+            Message(
+                text=m.get("text", ""),
+                user=(user_id := m.get("user", "")),
+                username=names.get(user_id, "Bot"),
+                channel=channel_id,
+                channel_name=channel_info.name,
+                timestamp=m.get("ts", ""),
             )
-        return messages
+            for m in history
+        ]
+        return messages, channel_info
 
-    def list_users(self) -> list[User]:
-        """List all users in the workspace."""
-        users = []
+    def iter_users(self) -> Iterator[User]:
+        """Yield active users in the workspace page by page."""
         cursor = None
 
         while True:
             try:
-                response = self.client.users_list(limit=200, cursor=cursor)
+                response = self._call_paged(self.client.users_list, cursor=cursor)
             except SlackApiError as e:
                 raise RuntimeError(f"Failed to list users: {e.response['error']}")
 
-            for u in response.get("members", []):
-                if u.get("deleted"):
-                    continue
-                user = User(
-                    id=u["id"],
-                    name=u.get("name", ""),
-                    real_name=u.get("real_name", ""),
-                    display_name=u.get("profile", {}).get("display_name", ""),
-                    is_bot=u.get("is_bot", False),
-                )
-                users.append(user)
-                self._user_cache[user.id] = user
+            members = response.get("members", [])
+            page = [User.from_api(u) for u in members if not u.get("deleted")]
+            self._cache_users(page)
+            yield from page
 
             cursor = response.get("response_metadata", {}).get("next_cursor")
             if not cursor:
                 break
 
-        return users
+    def list_users(self) -> list[User]:
+        """List all users in the workspace."""
+        return list(self.iter_users())
 
     def list_dm_conversations(self) -> list[Conversation]:
         """List all DM conversations."""
         try:
-            response = self.client.conversations_list(
-                types="im",
-                limit=200,
-            )
+            response = self._call_paged(self.client.conversations_list, types="im")
         except SlackApiError as e:
             raise RuntimeError(f"Failed to list DMs: {e.response['error']}")
 
+        ims = response.get("channels", [])
+        users = self._prefetch_users(c["user"] for c in ims if c.get("user"))
+
         conversations = []
-        for conv in response.get("channels", []):
+        for conv in ims:
             user_id = conv.get("user", "")
-            user = self._get_user(user_id) if user_id else None
+            user = users.get(user_id)
 
             conversations.append(
                 Conversation(
@@ -338,6 +624,7 @@ class SlackClient:
             response = self.client.conversations_open(users=[user_id])
             channel_id = response["channel"]["id"]
         except SlackApiError as e:
+            self.invalidate_user(user_id)
             raise RuntimeError(f"Failed to open DM: {e.response['error']}")
 
         try:
@@ -348,27 +635,22 @@ class SlackClient:
         except SlackApiError as e:
             raise RuntimeError(f"Failed to get DM history: {e.response['error']}")
 
-        target_user = self._get_user(user_id)
-        messages = []
-        for msg in response.get("messages", []):
-            msg_user_id = msg.get("user", "")
-            msg_user = self._get_user(msg_user_id) if msg_user_id else None
-
-            messages.append(
-                Message(
-                    text=msg.get("text", ""),
-                    user=msg_user_id,
-                    username=(
-                        msg_user.display_name or msg_user.real_name
-                        if msg_user
-                        else "Unknown"
-                    ),
-                    channel=channel_id,
-                    channel_name=f"DM with {target_user.display_name or target_user.real_name}",
-                    timestamp=msg.get("ts", ""),
-                )
+        history = response.get("messages", [])
+        names = self._usernames(history)
+
+        dm_user = self._get_user(user_id)
+        channel_name = f"DM with {dm_user.display_name or dm_user.real_name}"
+        return [
+            Message(
+                text=m.get("text", ""),
+                user=(msg_user_id := m.get("user", "")),
+                username=names.get(msg_user_id, "Unknown"),
+                channel=channel_id,
+                channel_name=channel_name,
+                timestamp=m.get("ts", ""),
             )
-        return messages
+            for m in history
+        ]
 
     def send_message(
         self,
@@ -386,7 +668,11 @@ class SlackClient:
         Returns:
             Tuple of (channel_id, message_timestamp)
         """
-        channel_id = self._resolve_channel_id(channel)
+        # chat.postMessage accepts IDs directly; only names need resolving.
+        if channel.startswith("C") or channel.startswith("G"):
+            channel_id = channel
+        else:
+            channel_id = self._resolve_channel(channel).id
 
         try:
             response = self.client.chat_postMessage(
@@ -396,4 +682,5 @@ class SlackClient:
             )
             return response["channel"], response["ts"]
         except SlackApiError as e:
+            self.invalidate_channel(channel_id)
             raise RuntimeError(f"Failed to send message: {e.response['error']}")
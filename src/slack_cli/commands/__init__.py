@@ -1,4 +1,8 @@
-"""Slack CLI commands."""
+"""Slack CLI commands.
+
+Handlers import SlackClient inside their bodies so that --help and
+--version do not pay for importing slack_sdk.
+"""
 
 from . import channel, dm, search
 
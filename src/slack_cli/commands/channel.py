@@ -4,11 +4,11 @@ from typing import Annotated
 
 import typer
 
-from ..client import SlackClient
 from ..formatters import (
     print_channel_info,
     print_channels,
     print_error,
+    print_hint,
     print_messages,
 )
 
@@ -35,25 +35,34 @@ def list_channels(
         "-t",
         help="Filter by type: public, private",
     ),
+    fetch_all: bool = typer.Option(
+        False,
+        "--all",
+        help="Fetch every page of results instead of only the first",
+    ),
 ) -> None:
     """List channels in the workspace."""
     try:
+        from ..client import SlackClient
+
         client = SlackClient()
 
+        types = None
         if channel_type == "private":
-            include_private = True
+            types = ["private_channel"]
+        elif channel_type == "public":
+            types = ["public_channel"]
 
-        channels = client.list_channels(
+        channels = client.iter_channels(
             include_private=include_private,
             include_archived=include_archived,
+            max_pages=None if fetch_all else 1,
+            types=types,
         )
 
-        if channel_type == "private":
-            channels = [ch for ch in channels if ch.is_private]
-        elif channel_type == "public":
-            channels = [ch for ch in channels if not ch.is_private]
-
         print_channels(channels)
+        if client.has_more_channels:
+            print_hint("More channels available — use --all to list them.")
     except ValueError as e:
         print_error(str(e))
         raise typer.Exit(1)
@@ -74,9 +83,10 @@ def channel_history(
 ) -> None:
     """Get message history from a channel."""
     try:
+        from ..client import SlackClient
+
         client = SlackClient()
-        messages = client.get_channel_history(channel, limit=limit)
-        channel_info = client.get_channel_info(channel)
+        messages, channel_info = client.get_channel_history(channel, limit=limit)
         print_messages(messages, title=f"History of #{channel_info.name}")
     except ValueError as e:
         print_error(str(e))
@@ -92,6 +102,8 @@ def channel_info(
 ) -> None:
     """Get detailed information about a channel."""
     try:
+        from ..client import SlackClient
+
         client = SlackClient()
         info = client.get_channel_info(channel)
         print_channel_info(info)
@@ -4,7 +4,6 @@ from typing import Annotated
 
 import typer
 
-from ..client import SlackClient
 from ..formatters import print_conversations, print_dm_history, print_error
 
 app = typer.Typer(help="Direct message operations.")
@@ -14,6 +13,8 @@ app = typer.Typer(help="Direct message operations.")
 def list_dms() -> None:
     """List all DM conversations."""
     try:
+        from ..client import SlackClient
+
         client = SlackClient()
         conversations = client.list_dm_conversations()
         print_conversations(conversations)
@@ -27,7 +28,7 @@ def list_dms() -> None:
 
 @app.command("history")
 def dm_history(
-    user: Annotated[str, typer.Argument(help="Username or user ID")],
+    user: Annotated[str, typer.Argument(help="Username, email, or user ID")],
     limit: int = typer.Option(
         50,
         "--limit",
@@ -37,6 +38,8 @@ def dm_history(
 ) -> None:
     """Get message history with a user."""
     try:
+        from ..client import SlackClient
+
         client = SlackClient()
         messages = client.get_dm_history(user, limit=limit)
 
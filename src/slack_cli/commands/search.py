@@ -4,7 +4,6 @@ from typing import Annotated
 
 import typer
 
-from ..client import SlackClient
 from ..formatters import print_error, print_search_results
 
 
@@ -25,6 +24,8 @@ def search(
 ) -> None:
     """Search messages in the workspace."""
     try:
+        from ..client import SlackClient
+
         client = SlackClient()
         messages = client.search_messages(query, channel=channel, limit=limit)
         print_search_results(messages, query)
@@ -5,11 +5,12 @@ from typing import Annotated
 
 import typer
 
-from ..client import SlackClient
 from ..formatters import print_error, print_sent_message
 
 app = typer.Typer(help="Send messages to Slack.")
 
+_SLACK_URL_RE = re.compile(r"https?://[^/]+/archives/([A-Z0-9]+)/p(\d+)")
+
 
 def parse_slack_url(url: str) -> tuple[str, str] | None:
     """Parse a Slack message URL to extract channel ID and thread timestamp.
@@ -20,8 +21,7 @@ def parse_slack_url(url: str) -> tuple[str, str] | None:
     Returns:
         Tuple of (channel_id, thread_ts) or None if not a valid URL
     """
-    pattern = r"https?://[^/]+/archives/([A-Z0-9]+)/p(\d+)"
-    match = re.match(pattern, url)
+    match = _SLACK_URL_RE.match(url)
     if match:
         channel_id = match.group(1)
         ts_raw = match.group(2)
@@ -43,10 +43,13 @@ def send(
 ) -> None:
     """Send a message to a channel."""
     try:
+        from ..client import SlackClient
+
         client = SlackClient()
         channel_id, ts = client.send_message(channel, message, thread_ts=thread)
-        channel_info = client.get_channel_info(channel_id)
-        print_sent_message(channel_info.name, ts, thread_ts=thread)
+        # Best effort: fall back to the ID rather than spend an API call.
+        name = client.cached_channel_name(channel_id) or channel_id
+        print_sent_message(name, ts, thread_ts=thread)
     except ValueError as e:
         print_error(str(e))
         raise typer.Exit(1)
@@ -73,10 +76,12 @@ def reply(
     channel_id, thread_ts = parsed
 
     try:
+        from ..client import SlackClient
+
         client = SlackClient()
         result_channel, ts = client.send_message(channel_id, message, thread_ts=thread_ts)
-        channel_info = client.get_channel_info(result_channel)
-        print_sent_message(channel_info.name, ts, thread_ts=thread_ts)
+        name = client.cached_channel_name(result_channel) or result_channel
+        print_sent_message(name, ts, thread_ts=thread_ts)
     except ValueError as e:
         print_error(str(e))
         raise typer.Exit(1)
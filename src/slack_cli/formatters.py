@@ -1,37 +1,61 @@
-"""Rich-based output formatters for Slack CLI."""
+"""Rich-based output formatters for Slack CLI.
 
+rich is imported lazily so that paths which print nothing (--help,
+--version) do not pay its import cost.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
 from datetime import datetime
+from functools import cache, lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from .client import Channel, Conversation, Message
+
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+@cache
+def get_console() -> Console:
+    """Return the shared rich Console, creating it on first use."""
+    from rich.console import Console
 
-from .client import Channel, Conversation, Message
+    return Console()
 
-console = Console()
+
+@lru_cache(maxsize=2048)
+def _format_minute(minute: int) -> str:
+    """Format a minute-resolution epoch as "YYYY-MM-DD HH:MM"."""
+    dt = datetime.fromtimestamp(minute * 60)
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
 
 
 def format_timestamp(ts: str) -> str:
     """Format Slack timestamp to human-readable format."""
     try:
-        dt = datetime.fromtimestamp(float(ts))
-        return dt.strftime("%Y-%m-%d %H:%M")
-    except (ValueError, TypeError):
+        return _format_minute(int(float(ts) // 60))
+    except (ValueError, TypeError, OverflowError, OSError):
         return ts
 
 
 def print_messages(messages: list[Message], title: str = "Messages") -> None:
     """Print messages in a formatted table."""
+    from rich.table import Table
+    from rich.text import Text
+
+    console = get_console()
     if not messages:
         console.print("[dim]No messages found.[/dim]")
         return
 
     table = Table(title=title, show_lines=True)
-    table.add_column("Time", style="dim", width=16)
-    table.add_column("Channel", style="cyan", width=15)
-    table.add_column("User", style="green", width=15)
-    table.add_column("Message", style="white")
+    table.add_column("Time", style="dim", min_width=16, no_wrap=True)
+    table.add_column("Channel", style="cyan", width=15, min_width=15, no_wrap=True)
+    table.add_column("User", style="green", width=15, min_width=15, no_wrap=True)
+    table.add_column("Message", style="white", ratio=1)
 
     for msg in messages:
         table.add_row(
@@ -46,6 +70,10 @@ def print_messages(messages: list[Message], title: str = "Messages") -> None:
 
 def print_search_results(messages: list[Message], query: str) -> None:
     """Print search results with highlighting."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
     if not messages:
         console.print(f"[dim]No results found for '[yellow]{query}[/yellow]'[/dim]")
         return
@@ -67,38 +95,68 @@ def print_search_results(messages: list[Message], query: str) -> None:
         console.print(Panel(text, title=str(header), border_style="blue"))
 
 
-def print_channels(channels: list[Channel]) -> None:
-    """Print channels in a formatted table."""
-    if not channels:
+def print_channels(channels: Iterable[Channel]) -> None:
+    """Print channels in a formatted table.
+
+    On a terminal, rows are shown live as they arrive, so a lazily
+    paginated iterable shows the first page before later pages are
+    fetched. The live view only redraws until it fills the screen, and the
+    complete table is printed once at the end.
+    """
+    from contextlib import nullcontext
+
+    from rich.live import Live
+    from rich.table import Table
+    from rich.text import Text
+
+    console = get_console()
+    channels = iter(channels)
+    first = next(channels, None)
+    if first is None:
         console.print("[dim]No channels found.[/dim]")
         return
 
     table = Table(title="Channels")
-    table.add_column("Name", style="cyan")
-    table.add_column("Type", style="yellow", width=10)
+    table.add_column("Name", style="cyan", min_width=20, no_wrap=True)
+    table.add_column("Type", style="yellow", width=10, no_wrap=True)
     table.add_column("Members", style="green", justify="right", width=8)
-    table.add_column("Topic", style="white")
-
-    for ch in channels:
-        channel_type = "Private" if ch.is_private else "Public"
-        if ch.is_archived:
-            channel_type += " 📦"
-
-        members = str(ch.member_count) if ch.member_count is not None else "-"
-        topic = ch.topic[:50] + "..." if len(ch.topic) > 50 else ch.topic
-
-        table.add_row(
-            f"#{ch.name}",
-            channel_type,
-            members,
-            topic or "[dim]No topic[/dim]",
-        )
+    table.add_column("Topic", style="white", ratio=1, max_width=50)
+
+    live = (
+        Live(table, console=console, transient=True, auto_refresh=False)
+        if console.is_terminal
+        else None
+    )
+    with live or nullcontext():
+        for ch in chain([first], channels):
+            channel_type = "Private" if ch.is_private else "Public"
+            if ch.is_archived:
+                channel_type += " 📦"
+
+            members = str(ch.member_count) if ch.member_count is not None else "-"
+            table.add_row(
+                f"#{ch.name}",
+                channel_type,
+                members,
+                (
+                    Text(ch.topic, overflow="ellipsis", no_wrap=True)
+                    if ch.topic
+                    else "[dim]No topic[/dim]"
+                ),
+            )
+            # Once the screen is full the cropped view no longer changes.
+            if live is not None and table.row_count <= console.height:
+                live.refresh()
 
     console.print(table)
 
 
 def print_channel_info(channel: Channel) -> None:
     """Print detailed channel information."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
     info = Text()
     info.append(f"Name: ", style="bold")
     info.append(f"#{channel.name}\n", style="cyan")
@@ -131,6 +189,9 @@ def print_channel_info(channel: Channel) -> None:
 
 def print_conversations(conversations: list[Conversation]) -> None:
     """Print DM conversations in a formatted table."""
+    from rich.table import Table
+
+    console = get_console()
     if not conversations:
         console.print("[dim]No conversations found.[/dim]")
         return
@@ -152,6 +213,7 @@ def print_conversations(conversations: list[Conversation]) -> None:
 
 def print_dm_history(messages: list[Message], user_name: str) -> None:
     """Print DM history with a user."""
+    console = get_console()
     if not messages:
         console.print(f"[dim]No messages with {user_name}.[/dim]")
         return
@@ -166,16 +228,22 @@ def print_dm_history(messages: list[Message], user_name: str) -> None:
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    console.print(f"[red]Error:[/red] {message}")
+    get_console().print(f"[red]Error:[/red] {message}")
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[green]✓[/green] {message}")
+    get_console().print(f"[green]✓[/green] {message}")
+
+
+def print_hint(message: str) -> None:
+    """Print a dimmed hint."""
+    get_console().print(f"[dim]{message}[/dim]")
 
 
 def print_sent_message(channel: str, timestamp: str, thread_ts: str | None = None) -> None:
     """Print confirmation of a sent message."""
+    console = get_console()
     time_str = format_timestamp(timestamp)
     if thread_ts:
         console.print(f"[green]✓[/green] Reply sent to thread in [cyan]#{channel}[/cyan] at {time_str}")
@@ -0,0 +1,32 @@
+"""Shared pytest fixtures."""
+
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from slack_cli.client import SlackClient
+
+
+@pytest.fixture
+def make_client(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Callable[[], SlackClient]:
+    """Build SlackClients with a mocked WebClient sharing one cache dir.
+
+    Each call stands in for a separate CLI invocation.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    def make() -> SlackClient:
+        slack = SlackClient(token="xoxp-test")
+        slack.client = MagicMock()
+        return slack
+
+    return make
+
+
+@pytest.fixture
+def client(make_client: Callable[[], SlackClient]) -> SlackClient:
+    return make_client()
@@ -0,0 +1,177 @@
+"""Tests for the Slack CLI caches."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from slack_cli import cache
+from slack_cli.cache import DiskCache, TTLCache
+from slack_cli.client import CHANNEL_CACHE_TTL, Channel, SlackClient, User
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    monkeypatch.setattr(cache.time, "time", fake)
+    return fake
+
+
+def test_ttl_cache_expires_entries(clock: FakeClock) -> None:
+    c: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    c["a"] = 1
+    clock.now += 59
+    assert c["a"] == 1
+
+    clock.now += 1
+    assert "a" not in c
+    assert c.get("a") is None
+    assert len(c) == 0
+    assert c.values() == []
+
+
+def test_ttl_cache_evicts_least_recently_used(clock: FakeClock) -> None:
+    c: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    c["a"] = 1
+    c["b"] = 2
+    c["a"]  # touch "a" so "b" becomes the oldest
+    c["c"] = 3
+
+    assert list(c) == ["a", "c"]
+    assert "b" not in c
+
+
+def test_ttl_cache_overwrite_refreshes_expiry(clock: FakeClock) -> None:
+    c: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    c["a"] = 1
+    clock.now += 50
+    c["a"] = 2
+    clock.now += 50
+    assert c["a"] == 2
+
+
+def test_disk_cache_round_trip(tmp_path: Path, clock: FakeClock) -> None:
+    d = DiskCache(tmp_path / "slack-cli" / "cache.sqlite", ttl=60)
+    d.set_many("channel", [("C1", "general", {"id": "C1", "name": "general"})])
+
+    assert d.get("channel", "C1") == {"id": "C1", "name": "general"}
+    assert d.find("channel", "general") == {"id": "C1", "name": "general"}
+    assert d.get("user", "C1") is None
+
+    d.delete("channel", "C1")
+    assert d.get("channel", "C1") is None
+
+
+def test_disk_cache_expires_entries(tmp_path: Path, clock: FakeClock) -> None:
+    d = DiskCache(tmp_path / "cache.sqlite", ttl=60)
+    d.set("user", "U1", "alice", {"id": "U1"})
+    clock.now += 60
+
+    assert d.get("user", "U1") is None
+    assert d.find("user", "alice") is None
+
+
+def test_disk_cache_disables_itself_on_unwritable_path(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    d = DiskCache(blocker / "cache.sqlite", ttl=60)
+
+    d.set("user", "U1", "alice", {"id": "U1"})
+    assert d.get("user", "U1") is None
+    assert d.find("user", "alice") is None
+    assert d._disabled
+
+
+def test_invalidate_user(client: SlackClient) -> None:
+    user = User(id="U1", name="alice", real_name="Alice", display_name="", is_bot=False)
+    client._cache_users([user])
+    assert client._cached_user("U1") == user
+
+    client.invalidate_user("U1")
+    assert client._cached_user("U1") is None
+
+
+def test_invalidate_channel(client: SlackClient) -> None:
+    channel = Channel(
+        id="C1",
+        name="general",
+        is_private=False,
+        is_archived=False,
+        topic="",
+        purpose="",
+    )
+    client._cache_channels([channel])
+    assert client._cached_channel("C1") == channel
+
+    client.invalidate_channel("C1")
+    assert client._cached_channel("C1") is None
+
+
+def test_disk_cache_file_is_private(tmp_path: Path) -> None:
+    path = tmp_path / "slack-cli" / "cache.sqlite"
+    d = DiskCache(path, ttl=60)
+    d.set("user", "U1", "alice", {"id": "U1"})
+
+    assert path.parent.stat().st_mode & 0o777 == 0o700
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_disk_cache_per_entry_ttl(tmp_path: Path, clock: FakeClock) -> None:
+    d = DiskCache(tmp_path / "cache.sqlite", ttl=60)
+    d.set_many("channel", [("C1", "general", {"id": "C1"})], ttl=10)
+    clock.now += 10
+
+    assert d.get("channel", "C1") is None
+
+
+def test_stale_schema_entries_are_misses(client: SlackClient) -> None:
+    client._disk_cache.set("user", "U1", "alice", {"id": "U1", "old_field": 1})
+
+    assert client._cached_user("U1") is None
+
+
+def _channel_payload(topic: str) -> dict[str, object]:
+    return {"id": "C1", "name": "general", "topic": {"value": topic}}
+
+
+def test_channel_details_expire_across_invocations(
+    make_client: Callable[[], SlackClient], clock: FakeClock
+) -> None:
+    first = make_client()
+    first.client.conversations_list.return_value = {
+        "channels": [_channel_payload("old")],
+        "response_metadata": {"next_cursor": ""},
+    }
+    assert first.get_channel_info("general").topic == "old"
+
+    clock.now += CHANNEL_CACHE_TTL
+    second = make_client()
+    second.client.conversations_info.return_value = {
+        "channel": _channel_payload("new")
+    }
+
+    assert second.get_channel_info("general").topic == "new"
+    second.client.conversations_info.assert_called_once_with(channel="C1")
+    second.client.conversations_list.assert_not_called()
+
+
+def test_search_channel_names_persist_for_later_invocations(
+    make_client: Callable[[], SlackClient],
+) -> None:
+    first = make_client()
+    first.client.search_messages.return_value = {
+        "messages": {"matches": [{"text": "hi", "channel": {"id": "C1", "name": "general"}}]}
+    }
+    first.search_messages("hi")
+
+    second = make_client()
+    assert second.cached_channel_name("C1") == "general"
@@ -0,0 +1,144 @@
+"""Tests for SlackClient API usage."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from slack_cli.client import SlackClient
+
+
+def test_failed_user_lookups_are_not_repeated(client: SlackClient) -> None:
+    client.client.users_info.side_effect = SlackApiError(
+        "user_not_found", {"error": "user_not_found"}
+    )
+    client.client.conversations_info.return_value = {
+        "channel": {"id": "C1", "name": "general"}
+    }
+    client.client.conversations_history.return_value = {
+        "messages": [
+            {"user": "U1", "text": "a", "ts": "1"},
+            {"user": "U2", "text": "b", "ts": "2"},
+            {"user": "U1", "text": "c", "ts": "3"},
+        ]
+    }
+
+    messages, _ = client.get_channel_history("C1")
+
+    assert [m.username for m in messages] == ["Unknown User"] * 3
+    assert sorted(
+        call.kwargs["user"] for call in client.client.users_info.call_args_list
+    ) == ["U1", "U2"]
+
+
+def _page(*channels: dict[str, Any], cursor: str = "") -> dict[str, Any]:
+    return {"channels": list(channels), "response_metadata": {"next_cursor": cursor}}
+
+
+def test_iter_channels_paginates_each_type_separately(client: SlackClient) -> None:
+    client.client.conversations_list.side_effect = [
+        _page({"id": "C1", "name": "one"}, cursor="next"),
+        _page({"id": "C2", "name": "two"}),
+        _page({"id": "G1", "name": "secret", "is_private": True}),
+    ]
+
+    channels = list(client.iter_channels(include_private=True))
+
+    assert [ch.id for ch in channels] == ["C1", "C2", "G1"]
+    calls = [c.kwargs for c in client.client.conversations_list.call_args_list]
+    assert [(c["types"], c["cursor"], c["limit"]) for c in calls] == [
+        ("public_channel", None, 1000),
+        ("public_channel", "next", 1000),
+        ("private_channel", None, 1000),
+    ]
+
+
+def test_iter_channels_types_override_include_private(client: SlackClient) -> None:
+    client.client.conversations_list.return_value = _page(
+        {"id": "G1", "name": "secret", "is_private": True}
+    )
+
+    channels = list(client.iter_channels(include_private=False, types=["private_channel"]))
+
+    assert [ch.id for ch in channels] == ["G1"]
+    client.client.conversations_list.assert_called_once()
+    assert client.client.conversations_list.call_args.kwargs["types"] == "private_channel"
+
+
+def test_page_limit_fallback_sticks_for_later_pages(client: SlackClient) -> None:
+    client.client.conversations_list.side_effect = [
+        SlackApiError("invalid_limit", {"error": "invalid_limit"}),
+        _page({"id": "C1", "name": "one"}, cursor="next"),
+        _page({"id": "C2", "name": "two"}),
+        _page({"id": "G1", "name": "secret", "is_private": True}),
+    ]
+
+    channels = list(client.iter_channels(include_private=True))
+
+    assert [ch.id for ch in channels] == ["C1", "C2", "G1"]
+    limits = [c.kwargs["limit"] for c in client.client.conversations_list.call_args_list]
+    assert limits == [1000, 500, 500, 500]
+
+
+def _members(*users: dict[str, Any], cursor: str = "") -> dict[str, Any]:
+    return {"members": list(users), "response_metadata": {"next_cursor": cursor}}
+
+
+def test_resolve_user_by_email(client: SlackClient) -> None:
+    client.client.users_lookupByEmail.return_value = {
+        "user": {"id": "U9", "name": "ana"}
+    }
+
+    assert client._resolve_user_id("ana@example.com") == "U9"
+    client.client.users_lookupByEmail.assert_called_once_with(email="ana@example.com")
+    client.client.users_list.assert_not_called()
+
+
+def test_resolve_user_by_email_reports_lookup_errors(client: SlackClient) -> None:
+    client.client.users_lookupByEmail.side_effect = SlackApiError(
+        "users_not_found", {"error": "users_not_found"}
+    )
+
+    with pytest.raises(RuntimeError, match="users_not_found"):
+        client._resolve_user_id("nobody@example.com")
+
+
+def test_resolve_user_prefers_memory_then_disk(
+    make_client: Callable[[], SlackClient],
+) -> None:
+    first = make_client()
+    first.client.users_list.return_value = _members({"id": "U1", "name": "ana"})
+    assert first._resolve_user_id("ana") == "U1"
+    assert first._resolve_user_id("@ana") == "U1"
+    first.client.users_list.assert_called_once()
+
+    second = make_client()
+    assert second._resolve_user_id("ana") == "U1"
+    second.client.users_list.assert_not_called()
+
+
+def test_resolve_user_stops_paging_at_first_match(client: SlackClient) -> None:
+    client.client.users_list.side_effect = [
+        _members({"id": "U1", "name": "ana"}, cursor="next"),
+        _members({"id": "U2", "name": "bo"}),
+    ]
+
+    assert client._resolve_user_id("ana") == "U1"
+    client.client.users_list.assert_called_once()
+
+
+def test_iter_channels_reports_unfetched_pages(client: SlackClient) -> None:
+    client.client.conversations_list.side_effect = [
+        _page({"id": "C1", "name": "one"}, cursor="next"),
+        _page({"id": "G1", "name": "secret", "is_private": True}),
+    ]
+
+    channels = list(client.iter_channels(include_private=True, max_pages=1))
+
+    assert [ch.id for ch in channels] == ["C1", "G1"]
+    assert client.has_more_channels
+
+    client.client.conversations_list.side_effect = [_page({"id": "C1", "name": "one"})]
+    list(client.iter_channels(max_pages=1))
+    assert not client.has_more_channels